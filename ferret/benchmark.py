@@ -1,8 +1,10 @@
 """Client Interface Module"""
 
 import copy
+import threading
 import warnings
-from typing import Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Union
 
 import datasets
 import numpy as np
@@ -12,12 +14,14 @@ from tqdm.autonotebook import tqdm
 
 from .datasets import BaseDataset
 from .datasets.datamanagers import HateXplainDataset, MovieReviews, SSTDataset
+from .evaluators import EvaluationMetricFamily
 from .evaluators.class_measures import AOPC_Comprehensiveness_Evaluation_by_class
 from .evaluators.evaluation import EvaluationMetricOutput, ExplanationEvaluation
 from .evaluators.faithfulness_measures import (
     AOPC_Comprehensiveness_Evaluation,
     AOPC_Sufficiency_Evaluation,
     TauLOO_Evaluation,
+    _text_key,
 )
 from .evaluators.plausibility_measures import (
     AUPRC_PlausibilityEvaluation,
@@ -134,6 +138,42 @@ class Benchmark:
             outputs = self.model(**item)
         return outputs
 
+    def _reuse_precomputed_inputs(self, evaluators: List) -> bool:
+        """Whether any of the evaluators would reuse the inputs precomputed by
+        `_precompute_inputs`, i.e., it is a faithfulness evaluator on the benchmark model.
+        """
+        return any(
+            getattr(evaluator, "METRIC_FAMILY", None)
+            == EvaluationMetricFamily.FAITHFULNESS
+            and getattr(getattr(evaluator, "helper", None), "model", None) is self.model
+            for evaluator in evaluators
+        )
+
+    def _precompute_inputs(self, text) -> Dict:
+        """Tokenize the text and compute its logits once, so that faithfulness evaluators
+        sharing the benchmark model do not run the same forward pass again.
+        """
+        _, logits = self.helper._forward(text, output_hidden_states=False)
+        return dict(
+            model=self.model,
+            item=self.helper._tokenize(text),
+            logits=logits,
+        )
+
+    def _copy_evaluators(self) -> Tuple[List, List]:
+        """Copy the evaluators and class-based evaluators, with their own tokenizer.
+
+        Fast tokenizers are not thread-safe: a call changing the padding while another
+        thread is encoding raises "Already borrowed". Each thread evaluating
+        explanations works with its own copy. The models are shared, not copied.
+        """
+        memo = {id(self.model): self.model}
+        for evaluator in self.evaluators + self.class_based_evaluators:
+            model = getattr(getattr(evaluator, "helper", None), "model", None)
+            if model is not None:
+                memo[id(model)] = model
+        return copy.deepcopy((self.evaluators, self.class_based_evaluators), memo)
+
     def score(self, text: str, return_dict: bool = True, **kwargs):
         """Compute prediction scores for a single query
 
@@ -251,16 +291,38 @@ class Benchmark:
         Returns:
             ExplanationEvaluation: the evaluation of the explanation
         """
+        return self._evaluate_explanation(
+            explanation,
+            human_rationale,
+            class_explanation,
+            show_progress,
+            dict(),
+            self.evaluators,
+            self.class_based_evaluators,
+            **evaluation_args,
+        )
 
-        evaluations = list()
+    def _evaluate_explanation(
+        self,
+        explanation: Union[Explanation, ExplanationWithRationale],
+        human_rationale,
+        class_explanation: List[Union[Explanation, ExplanationWithRationale]],
+        show_progress: bool,
+        batch_evaluations: Dict[int, EvaluationMetricOutput],
+        evaluators: List,
+        class_based_evaluators: List,
+        **evaluation_args,
+    ) -> ExplanationEvaluation:
+        """Evaluate an explanation as in `evaluate_explanation`.
 
-        if show_progress:
-            total_evaluators = (
-                len(self.evaluators) + len(self.class_based_evaluators)
-                if class_explanation is not None
-                else len(self.evaluators)
-            )
-            pbar = tqdm(total=total_evaluators, desc="Evaluator", leave=False)
+        Args:
+            batch_evaluations (Dict[int, EvaluationMetricOutput]): evaluations already computed for the explanation, by position of the evaluator in self.evaluators. These evaluators are not run again.
+            evaluators (List): the evaluators to run, self.evaluators or a copy of them
+            class_based_evaluators (List): the class-based evaluators to run, self.class_based_evaluators or a copy of them
+        """
+
+        if class_explanation is None:
+            class_based_evaluators = list()
 
         add_first_last = evaluation_args.get("add_first_last", True)
         explanation = (
@@ -269,27 +331,45 @@ class Benchmark:
             else explanation
         )
 
-        for evaluator in self.evaluators:
-            evaluation = evaluator.compute_evaluation(explanation, **evaluation_args)
-            if (
-                evaluation is not None
-            ):  # return None for plausibility measure if rationale is not available
-                evaluations.append(evaluation)
+        pending_evaluators = [
+            evaluator
+            for evaluator_idx, evaluator in enumerate(evaluators)
+            if evaluator_idx not in batch_evaluations
+        ]
+        if evaluation_args.get(
+            "precomputed_inputs", None
+        ) is None and self._reuse_precomputed_inputs(pending_evaluators):
+            evaluation_args["precomputed_inputs"] = {
+                _text_key(explanation.text): self._precompute_inputs(explanation.text)
+            }
 
-            if show_progress:
+        evaluations = list()
+        with tqdm(
+            total=len(evaluators) + len(class_based_evaluators),
+            desc="Evaluator",
+            leave=False,
+            disable=not show_progress,
+        ) as pbar:
+            for evaluator_idx, evaluator in enumerate(evaluators):
+                if evaluator_idx in batch_evaluations:
+                    evaluation = batch_evaluations[evaluator_idx]
+                else:
+                    evaluation = evaluator.compute_evaluation(
+                        explanation, **evaluation_args
+                    )
+                if (
+                    evaluation is not None
+                ):  # return None for plausibility measure if rationale is not available
+                    evaluations.append(evaluation)
                 pbar.update(1)
 
-        if class_explanation is not None:
-            for class_based_evaluator in self.class_based_evaluators:
+            for class_based_evaluator in class_based_evaluators:
                 class_based_evaluation = class_based_evaluator.compute_evaluation(
                     class_explanation, **evaluation_args
                 )
                 evaluations.append(class_based_evaluation)
-                if show_progress:
-                    pbar.update(1)
+                pbar.update(1)
 
-        if show_progress:
-            pbar.close()
         explanation_eval = ExplanationEvaluation(explanation, evaluations)
 
         return explanation_eval
@@ -300,6 +380,7 @@ class Benchmark:
         human_rationale=None,
         class_explanations=None,
         show_progress=True,
+        n_workers: int = 1,
         **evaluation_args,
     ) -> List[ExplanationEvaluation]:
         """Evaluate explanations using all the evaluators stored in the class.
@@ -310,37 +391,110 @@ class Benchmark:
             human rationale (list): one-hot-encoding indicating if the token is in the human rationale (1) or not (0). If available, all explanations are evaluated for the human rationale (if provided)
             class_explanation (list): list of list of explanations. The k-th element represents the list of explanations computed varying the target class: the explanation in position k, i is computed using as target class the class label i. The size is # explanation, #target classes. If available, class-based scores are computed.
             show_progress (bool): enable progress bar
+            n_workers (int): number of threads evaluating explanations concurrently. Model calls release the GIL, so evaluations can overlap. Each thread uses its own copy of the evaluators and tokenizer, since fast tokenizers are not thread-safe, while models are shared: every call with n_workers > 1 deep-copies the evaluators and their tokenizers once per thread, which only pays off when evaluating many explanations. Default 1 (sequential): not every CUDA operation is thread-safe either
 
         Returns:
             List[ExplanationEvaluation]: the evaluation for each explanation
         """
 
-        explanation_evaluations = list()
-
         class_explanations_by_explainer = self._get_class_explanations_by_explainer(
             class_explanations
         )
-        if show_progress:
-            pbar = tqdm(total=len(explanations), desc="Explanation eval", leave=False)
-
-        for i, explanation in enumerate(explanations):
-            class_explanation = None
-            if class_explanations_by_explainer is not None:
-                class_explanation = class_explanations_by_explainer[i]
-
-            explanation_evaluations.append(
-                self.evaluate_explanation(
-                    explanation,
-                    human_rationale,
-                    class_explanation,
-                    show_progress=False,
-                    **evaluation_args,
+        if class_explanations_by_explainer is None:
+            class_explanations_by_explainer = [None] * len(explanations)
+        elif len(class_explanations_by_explainer) != len(explanations):
+            raise ValueError(
+                f"class_explanations cover {len(class_explanations_by_explainer)} "
+                f"explainers, but {len(explanations)} explanations are evaluated"
+            )
+
+        # The model outputs on each original text are computed once and shared by the
+        # faithfulness evaluators of all its explanations
+        if evaluation_args.get(
+            "precomputed_inputs", None
+        ) is None and self._reuse_precomputed_inputs(self.evaluators):
+            precomputed_inputs = dict()
+            for explanation in explanations:
+                text_key = _text_key(explanation.text)
+                if text_key not in precomputed_inputs:
+                    precomputed_inputs[text_key] = self._precompute_inputs(
+                        explanation.text
+                    )
+            evaluation_args["precomputed_inputs"] = precomputed_inputs
+
+        n_workers = min(n_workers, len(explanations))
+        thread_data = threading.local()
+        copy_lock = threading.Lock()
+
+        def init_worker():
+            # One copy of the evaluators (and tokenizer) for each thread. Copies are made
+            # one at a time, since copying reads the shared tokenizer
+            with copy_lock:
+                thread_data.evaluators = self._copy_evaluators()
+
+        def evaluate(explanation, class_explanation, explanation_batch_evaluations):
+            if n_workers > 1:
+                evaluators, class_based_evaluators = thread_data.evaluators
+            else:
+                evaluators, class_based_evaluators = (
+                    self.evaluators,
+                    self.class_based_evaluators,
                 )
+            return self._evaluate_explanation(
+                explanation,
+                human_rationale,
+                class_explanation,
+                False,
+                explanation_batch_evaluations,
+                evaluators,
+                class_based_evaluators,
+                **evaluation_args,
             )
-            if show_progress:
+
+        batched_evaluators = [
+            (evaluator_idx, evaluator)
+            for evaluator_idx, evaluator in enumerate(self.evaluators)
+            if hasattr(evaluator, "compute_evaluations")
+        ]
+
+        with tqdm(
+            total=len(batched_evaluators) + len(explanations),
+            desc="Explanation eval",
+            leave=False,
+            disable=not show_progress,
+        ) as pbar:
+            # Evaluators supporting it score all the explanations at once, batching the
+            # model forward passes across explainers
+            batch_evaluations = [dict() for _ in explanations]
+            for evaluator_idx, evaluator in batched_evaluators:
+                evaluations = evaluator.compute_evaluations(
+                    explanations, **evaluation_args
+                )
+                for i, evaluation in enumerate(evaluations):
+                    batch_evaluations[i][evaluator_idx] = evaluation
                 pbar.update(1)
-        if show_progress:
-            pbar.close()
+
+            # Evaluate the remaining metrics, optionally overlapping explanations in threads
+            executor = (
+                ThreadPoolExecutor(max_workers=n_workers, initializer=init_worker)
+                if n_workers > 1
+                else None
+            )
+            try:
+                explanation_evaluations = list()
+                for explanation_evaluation in (
+                    executor.map if executor is not None else map
+                )(
+                    evaluate,
+                    explanations,
+                    class_explanations_by_explainer,
+                    batch_evaluations,
+                ):
+                    explanation_evaluations.append(explanation_evaluation)
+                    pbar.update(1)
+            finally:
+                if executor is not None:
+                    executor.shutdown()
         return explanation_evaluations
 
     def _add_rationale(
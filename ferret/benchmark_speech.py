@@ -1,9 +1,10 @@
+from collections import defaultdict
+
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Union, Tuple
 from pydub import AudioSegment
 import torch
-import seaborn as sns
 from IPython.display import display
 from .explainers.explanation_speech.loo_speech_explainer import LOOSpeechExplainer
 from .explainers.explanation_speech.gradient_speech_explainer import GradientSpeechExplainer
@@ -11,8 +12,7 @@ from .explainers.explanation_speech.lime_speech_explainer import LIMESpeechExpla
 from .explainers.explanation_speech.paraling_speech_explainer import ParalinguisticSpeechExplainer
 from .explainers.explanation_speech.explanation_speech import ExplanationSpeech
 from .speechxai_utils import pydub_to_np, print_log
-
-SCORES_PALETTE = sns.diverging_palette(240, 10, as_cmap=True)
+from .visualization import get_colormap
 
 ## Set seed
 SEED = 42
@@ -25,6 +25,27 @@ USE_ADD_NOISE_TORCHAUDIO = True
 REFERENCE_STR = "-"
 
 
+def _dedup_column_names(columns) -> List:
+    """Rename duplicated column names as pandas' readers do: a, a.1, a.2, ...
+
+    A suffix is bumped until the name is unused, so ['a', 'a', 'a.1'] becomes
+    ['a', 'a.1', 'a.1.1']. Speech tables keep this format rather than the a_0, a_1
+    format of visualization.deduplicate_column_names, which also renames the first
+    occurrence.
+    """
+    names = list(columns)
+    counts = defaultdict(int)
+    for i, name in enumerate(names):
+        count = counts[name]
+        while count > 0:
+            counts[name] = count + 1
+            name = f"{name}.{count}"
+            count = counts[name]
+        names[i] = name
+        counts[name] = count + 1
+    return names
+
+
 class SpeechBenchmark:
     def __init__(
         self,
@@ -227,14 +248,14 @@ class SpeechBenchmark:
         # Rename duplicate columns (tokens) by adding a suffix
         table = self.create_table(explanations)
 
-        if sum(table.columns.duplicated().astype(int)) > 0:
-            table.columns = pd.io.parsers.base_parser.ParserBase(
-                {"names": table.columns, "usecols": None}
-            )._maybe_dedup_names(table.columns)
+        if table.columns.duplicated().any():
+            table.columns = _dedup_column_names(table.columns)
 
         return (
             table.apply(pd.to_numeric)
-            .style.background_gradient(axis=1, cmap=SCORES_PALETTE, vmin=-1, vmax=1)
+            .style.background_gradient(
+                axis=1, cmap=get_colormap("blue_red"), vmin=-1, vmax=1
+            )
             .format(precision=decimals)
             if apply_style
             else table.apply(pd.to_numeric).style.format(precision=decimals)
@@ -1,12 +1,15 @@
 """Datasets API"""
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Tuple
 
 TRAIN_SET = "TRAIN_SET"
 VALIDATION_SET = "VALIDATION_SET"
 TEST_SET = "TEST_SET"
 
+# Maximum number of words whose token ids are memoized by each dataset
+TOKEN_CACHE_MAXSIZE = 100_000
+
 
 class BaseDataset(ABC):
     @property
@@ -23,6 +26,16 @@ class BaseDataset(ABC):
     def __init__(self, tokenizer):
         self.tokenizer = tokenizer
 
+    @property
+    def tokenizer(self):
+        return self._tokenizer
+
+    @tokenizer.setter
+    def tokenizer(self, tokenizer):
+        # Cached token ids are only valid for the tokenizer that produced them
+        self._tokenizer = tokenizer
+        self._token_cache = dict()
+
     @abstractmethod
     def get_instance(self, idx: int, split_type: str = TEST_SET):
         pass
@@ -43,6 +56,26 @@ class BaseDataset(ABC):
     def _get_ground_truth(self, idx, split_type: str = TEST_SET):
         pass
 
+    def _encode_inner(self, word: str) -> Tuple[int, ...]:
+        """Token ids of a single word, without the special tokens.
+
+        Results are memoized per dataset instance: the same words (articles, punctuation,
+        stopwords) are typically encoded many times across the dataset. The cache is
+        emptied whenever the tokenizer is replaced. This is not an LRU cache: once it
+        holds TOKEN_CACHE_MAXSIZE words, it is emptied entirely.
+        """
+        token_ids = self._token_cache.get(word)
+        if token_ids is None:
+            token_ids = tuple(self.tokenizer.encode(word)[1:-1])
+            if len(self._token_cache) >= TOKEN_CACHE_MAXSIZE:
+                self._token_cache.clear()
+            self._token_cache[word] = token_ids
+        return token_ids
+
+    def clear_token_cache(self):
+        """Empty the cache of word token ids, e.g., after changing the tokenizer in place."""
+        self._token_cache = dict()
+
     def get_true_rationale_from_words_to_tokens(
         self, word_based_tokens: List[str], words_based_rationales: List[int]
     ) -> List[int]:
@@ -51,10 +84,31 @@ class BaseDataset(ABC):
         # Typically, the importance is associated with each word rather than each token.
         # We convert each word in token using the tokenizer. If a word is in the rationale,
         # we consider as important all the tokens of the word.
+        # Fast tokenizers encode all the words at once and map each token back to its
+        # word. Byte-level BPE tokenizers (e.g., RoBERTa, GPT-2) only accept pre-split
+        # words if instantiated with add_prefix_space=True.
+        if getattr(self.tokenizer, "is_fast", False) and getattr(
+            self.tokenizer, "add_prefix_space", True
+        ):
+            try:
+                encoding = self.tokenizer(
+                    list(word_based_tokens),
+                    is_split_into_words=True,
+                    add_special_tokens=False,
+                )
+            except (ValueError, AssertionError):
+                encoding = None
+            if encoding is not None:
+                # As with zip below, words beyond the rationale (e.g., an empty one) are dropped
+                n_rationales = len(words_based_rationales)
+                return [
+                    words_based_rationales[word_id]
+                    for word_id in encoding.word_ids()
+                    if word_id is not None and word_id < n_rationales
+                ]
+
         token_rationale = []
         for t, rationale_t in zip(word_based_tokens, words_based_rationales):
-            converted_token = self.tokenizer.encode(t)[1:-1]
-
-            for token_i in converted_token:
-                token_rationale.append(rationale_t)
+            converted_token = self._encode_inner(t)
+            token_rationale.extend([rationale_t] * len(converted_token))
         return token_rationale
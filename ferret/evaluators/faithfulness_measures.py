@@ -16,12 +16,94 @@ from .utils_from_soft_to_discrete import (
 )
 
 
+def _text_key(text):
+    """Hashable key of a text to explain: a string, a (premise, hypothesis) tuple or,
+    e.g., for zero-shot classification, a list of them.
+    """
+    return tuple(text) if isinstance(text, list) else text
+
+
+def _forward_and_tokenize(helper, text, evaluation_args):
+    """Get the logits and the tokenized input of the text to explain.
+
+    If the caller already computed them for this text and model, they are passed in
+    evaluation_args as "precomputed_inputs", a dict mapping the `_text_key` of each text
+    to a dict with keys model, item and logits, and reused instead of running the model
+    again.
+    """
+    precomputed = (evaluation_args.get("precomputed_inputs", None) or dict()).get(
+        _text_key(text), None
+    )
+    if precomputed is not None and precomputed["model"] is helper.model:
+        return precomputed["logits"], precomputed["item"]
+
+    _, logits = helper._forward(text, output_hidden_states=False)
+    item = helper._tokenize(text)
+    return logits, item
+
+
 def _compute_aopc(scores):
     from statistics import mean
 
     return mean(scores)
 
 
+def _compute_aopc_batch(
+    evaluator: BaseEvaluator,
+    explanations: List[Explanation],
+    removal_samples: List[Tuple[float, List[str]]],
+    default_score: float,
+) -> List[EvaluationMetricOutput]:
+    """Compute the AOPC score of each explanation from its baseline probability and
+    perturbed inputs. The perturbed inputs of all the explanations of the same text are
+    scored together.
+    """
+    # Token-level logits (e.g., NER) are padded to the longest input of each forward
+    # batch, so only the perturbed inputs of the same text can be concatenated
+    explanation_ids_by_text = dict()
+    for i, (explanation, (_, samples)) in enumerate(zip(explanations, removal_samples)):
+        if samples:
+            text_key = _text_key(explanation.text)
+            explanation_ids_by_text.setdefault(text_key, list()).append(i)
+
+    logits_by_explanation = dict()
+    for explanation_ids in explanation_ids_by_text.values():
+        # Prediction probability for the target of each perturbed input
+        _, logits = evaluator.helper._forward(
+            [sample for i in explanation_ids for sample in removal_samples[i][1]],
+            output_hidden_states=False,
+        )
+        logits_by_explanation.update(
+            zip(
+                explanation_ids,
+                logits.split([len(removal_samples[i][1]) for i in explanation_ids]),
+            )
+        )
+
+    evaluation_outputs = list()
+    for i, (explanation, (baseline, samples)) in enumerate(
+        zip(explanations, removal_samples)
+    ):
+        if samples == list():
+            evaluation_outputs.append(EvaluationMetricOutput(evaluator, default_score))
+            continue
+
+        logits = evaluator.helper._postprocess_logits(
+            logits_by_explanation[i],
+            target_token_pos_idx=explanation.target_token_pos_idx,
+        )
+        probs_removing = (
+            logits.softmax(-1)[:, explanation.target_pos_idx].cpu().numpy()
+        )
+
+        # compute probability difference
+        removal_importance = baseline - probs_removing
+        aopc = _compute_aopc(removal_importance)
+        evaluation_outputs.append(EvaluationMetricOutput(evaluator, aopc))
+
+    return evaluation_outputs
+
+
 class AOPC_Comprehensiveness_Evaluation(BaseEvaluator):
     NAME = "aopc_comprehensiveness"
     SHORT_NAME = "aopc_compr"
@@ -50,6 +132,36 @@ class AOPC_Comprehensiveness_Evaluation(BaseEvaluator):
         Returns:
             Evaluation : the AOPC Comprehensiveness score of the explanation
         """
+        return self.compute_evaluations([explanation], **evaluation_args)[0]
+
+    def compute_evaluations(
+        self, explanations: List[Explanation], **evaluation_args
+    ) -> List[EvaluationMetricOutput]:
+        """Evaluate multiple explanations on the AOPC Comprehensiveness metric.
+
+        The perturbed inputs of all the explanations of the same text (e.g., by different
+        explainers) are scored with a single batched forward pass.
+
+        Args:
+            explanations (List[Explanation]): the explanations to evaluate
+            evaluation_args (dict):  additional evaluation args, as in compute_evaluation
+
+        Returns:
+            List[Evaluation] : the AOPC Comprehensiveness score of each explanation
+        """
+        return _compute_aopc_batch(
+            self,
+            explanations,
+            [self._get_removal_samples(e, **evaluation_args) for e in explanations],
+            default_score=0,
+        )
+
+    def _get_removal_samples(
+        self, explanation: Explanation, **evaluation_args
+    ) -> Tuple[float, List[str]]:
+        """Get the prediction probability of the target for the full input and the
+        inputs to score, i.e., the input without the discrete rationale at each threshold.
+        """
 
         remove_first_last, only_pos, removal_args, _ = parse_evaluator_args(
             evaluation_args
@@ -72,7 +184,7 @@ class AOPC_Comprehensiveness_Evaluation(BaseEvaluator):
 
         # TODO - use tokens
         # Get prediction probability of the input sencence for the target
-        _, logits = self.helper._forward(text, output_hidden_states=False)
+        logits, item = _forward_and_tokenize(self.helper, text, evaluation_args)
         logits = self.helper._postprocess_logits(
             logits, target_token_pos_idx=target_token_pos_idx
         )
@@ -81,7 +193,6 @@ class AOPC_Comprehensiveness_Evaluation(BaseEvaluator):
 
         # TODO This part needs serious revision if metrics have to be general across modalities
         # Tokenized input
-        item = self.helper._tokenize(text)
         input_len = item["attention_mask"].sum().item()
         input_ids = item["input_ids"][0][:input_len].tolist()
 
@@ -139,24 +250,7 @@ class AOPC_Comprehensiveness_Evaluation(BaseEvaluator):
 
             discrete_expl_ths.append(discrete_expl_th)
 
-        if discrete_expl_ths == list():
-            return EvaluationMetricOutput(self, 0)
-
-        # Prediction probability for the target and post process logits
-        _, logits = self.helper._forward(discrete_expl_ths, output_hidden_states=False)
-        logits = self.helper._postprocess_logits(
-            logits, target_token_pos_idx=target_token_pos_idx
-        )
-
-        probs_removing = logits.softmax(-1)[:, target_pos_idx].cpu().numpy()
-
-        # compute probability difference
-        removal_importance = baseline - probs_removing
-        #  compute AOPC comprehensiveness
-        aopc_comprehesiveness = _compute_aopc(removal_importance)
-
-        evaluation_output = EvaluationMetricOutput(self, aopc_comprehesiveness)
-        return evaluation_output
+        return baseline, discrete_expl_ths
 
     # def aggregate_score(self, score, total, **aggregation_args):
     #     return super().aggregate_score(score, total, **aggregation_args)
@@ -184,6 +278,36 @@ class AOPC_Sufficiency_Evaluation(BaseEvaluator):
         Returns:
             Evaluation : the AOPC Sufficiency score of the explanation
         """
+        return self.compute_evaluations([explanation], **evaluation_args)[0]
+
+    def compute_evaluations(
+        self, explanations: List[Explanation], **evaluation_args
+    ) -> List[EvaluationMetricOutput]:
+        """Evaluate multiple explanations on the AOPC Sufficiency metric.
+
+        The perturbed inputs of all the explanations of the same text (e.g., by different
+        explainers) are scored with a single batched forward pass.
+
+        Args:
+            explanations (List[Explanation]): the explanations to evaluate
+            evaluation_args (dict):  additional evaluation args, as in compute_evaluation
+
+        Returns:
+            List[Evaluation] : the AOPC Sufficiency score of each explanation
+        """
+        return _compute_aopc_batch(
+            self,
+            explanations,
+            [self._get_removal_samples(e, **evaluation_args) for e in explanations],
+            default_score=1,
+        )
+
+    def _get_removal_samples(
+        self, explanation: Explanation, **evaluation_args
+    ) -> Tuple[float, List[str]]:
+        """Get the prediction probability of the target for the full input and the
+        inputs to score, i.e., only the discrete rationale at each threshold.
+        """
 
         remove_first_last, only_pos, removal_args, _ = parse_evaluator_args(
             evaluation_args
@@ -206,14 +330,13 @@ class AOPC_Sufficiency_Evaluation(BaseEvaluator):
 
         # TO DO - use tokens
         # Get prediction probability of the input sencence for the target
-        _, logits = self.helper._forward(text, output_hidden_states=False)
+        # and the tokenized sentence
+        logits, item = _forward_and_tokenize(self.helper, text, evaluation_args)
         logits = self.helper._postprocess_logits(
             logits, target_token_pos_idx=target_token_pos_idx
         )
         baseline = logits.softmax(-1)[0, target_pos_idx].item()
 
-        # Tokenized sentence
-        item = self.helper._tokenize(text)
         # Get token ids of the sentence
         input_len = item["attention_mask"].sum().item()
         input_ids = item["input_ids"][0][:input_len].tolist()
@@ -277,23 +400,7 @@ class AOPC_Sufficiency_Evaluation(BaseEvaluator):
             )
             discrete_expl_ths.append(discrete_expl_th)
 
-        if discrete_expl_ths == []:
-            return EvaluationMetricOutput(self, 1)
-
-        # Prediction probability for the target
-        _, logits = self.helper._forward(discrete_expl_ths, output_hidden_states=False)
-        logits = self.helper._postprocess_logits(
-            logits, target_token_pos_idx=target_token_pos_idx
-        )
-        probs_removing = logits.softmax(-1)[:, target_pos_idx].cpu().numpy()
-
-        # Compute probability difference
-        removal_importance = baseline - probs_removing
-
-        aopc_sufficiency = _compute_aopc(removal_importance)
-
-        evaluation_output = EvaluationMetricOutput(self, aopc_sufficiency)
-        return evaluation_output
+        return baseline, discrete_expl_ths
 
     # def aggregate_score(self, score, total, **aggregation_args):
     #     return super().aggregate_score(score, total, **aggregation_args)
@@ -336,14 +443,13 @@ class TauLOO_Evaluation(BaseEvaluator):
             if self.tokenizer.cls_token == explanation.tokens[0]:
                 score_explanation = score_explanation[1:-1]
 
-        _, logits = self.helper._forward(text, output_hidden_states=False)
+        logits, item = _forward_and_tokenize(self.helper, text, evaluation_args)
         logits = self.helper._postprocess_logits(
             logits, target_token_pos_idx=target_token_pos_idx
         )
 
         baseline = logits.softmax(-1)[0, target_pos_idx].item()
 
-        item = self.helper._tokenize(text)
         input_len = item["attention_mask"].sum().item()
         input_ids = item["input_ids"][0][:input_len].tolist()
         if remove_first_last == True:
@@ -65,40 +65,42 @@ def plot_word_importance_summary(
         .sort_values(by=[ALL, "count"], ascending=False)
         .head(top_k)
     )
+    # Classes (and the count and average columns) by rows, words by columns
+    sel_t = sel.T
+    scores = sel_t.to_numpy()
 
-    n_colors = len([i for i in list(sel.T.index)])
+    n_colors = len(sel_t.index)
 
     if n_colors < 20:
         cmap = plt.get_cmap("tab20")
         colors = {
             color_label: cm.to_hex(cmap(e))
-            for e, color_label in enumerate(list(sel.T.index))
+            for e, color_label in enumerate(list(sel_t.index))
         }
     else:
         cmap = plt.get_cmap("gist_rainbow")
 
         colors = {
             color_label: cm.to_hex(cmap(1.0 * e / n_colors))
-            for e, color_label in enumerate(list(sel.T.index))
+            for e, color_label in enumerate(list(sel_t.index))
         }
 
     fig, ax = plt.subplots(figsize=figsize)
-    stacked = np.zeros(len(sel.T.columns))
-    stacked_pos = np.zeros(len(sel.T.columns))
-    stacked_neg = np.zeros(len(sel.T.columns))
+    stacked = np.zeros(len(sel_t.columns))
+    stacked_pos = np.zeros(len(sel_t.columns))
+    stacked_neg = np.zeros(len(sel_t.columns))
 
     # This is just to have the words in the defined order: by highest average importance and count
     ax.barh(
-        list(sel.T.columns)[::-1],
-        np.zeros(len(sel.T.columns)),
+        list(sel_t.columns)[::-1],
+        np.zeros(len(sel_t.columns)),
         height=height,
         label=None,
     )
 
-    for class_value_id in sel.T.index:
+    labels = sel_t.columns
+    for class_value_id, vals in zip(sel_t.index, scores):
         if class_value_id not in ["count", ALL]:
-            vals = sel.T.loc[class_value_id].values
-            labels = sel.T.columns
 
             if n_colors > 20:
                 label_name = (
@@ -1,16 +1,30 @@
 from collections import Counter, defaultdict
+from functools import lru_cache
 from typing import Dict, List, Optional
 
+import numpy as np
 import pandas as pd
-import seaborn as sns
-from matplotlib.colors import LinearSegmentedColormap
-
 from .evaluators.evaluation import ExplanationEvaluation
 from .explainers.explanation import Explanation
 from .evaluators import EvaluationMetricFamily
 
 
+@lru_cache(maxsize=1)
+def _get_sns():
+    """Import seaborn (and matplotlib) on first use rather than when importing ferret."""
+    import seaborn as sns
+
+    return sns
+
+
+@lru_cache(maxsize=None)
 def get_colormap(format):
+    """Get the colormap for the given format.
+
+    Colormaps are built once and shared across calls: the same few colormaps are
+    requested for every metric of every evaluation table.
+    """
+    sns = _get_sns()
 
     if format == "blue_red":
         return sns.diverging_palette(240, 10, as_cmap=True)
@@ -19,6 +33,8 @@ def get_colormap(format):
     elif format == "purple_white":
         return sns.light_palette("purple", as_cmap=True, reverse=True)
     elif format == "white_purple_white":
+        from matplotlib.colors import LinearSegmentedColormap
+
         colors = ["white", "purple", "white"]
         return LinearSegmentedColormap.from_list("diverging_white_purple", colors)
     else:
@@ -35,14 +51,21 @@ def get_dataframe(explanations: List[Explanation]) -> pd.DataFrame:
         pd.DataFrame: explanations in table format. The columns are the tokens and the rows are the explanation scores, one for each explainer.
     """
     scores = {e.explainer: e.scores for e in explanations}
-    scores["Token"] = explanations[0].tokens
-    table = pd.DataFrame(scores).set_index("Token").T
+    table = pd.DataFrame(
+        list(scores.values()),
+        index=list(scores),
+        columns=pd.Index(explanations[0].tokens, name="Token"),
+    )
     return table
 
 
 def deduplicate_column_names(df):
-    # Create a copy of the DataFrame to avoid modifying the original
-    df_copy = df.copy()
+    if not df.columns.has_duplicates:
+        return df
+
+    # Rename the columns of a shallow copy: the original is not modified and the
+    # data is not copied
+    df_copy = df.copy(deep=False)
 
     column_counts = Counter(df_copy.columns)
 
@@ -61,6 +84,22 @@ def deduplicate_column_names(df):
     return df_copy
 
 
+def _has_values(df: pd.DataFrame, subset) -> bool:
+    """Whether the subset of the DataFrame contains any non-NaN value.
+
+    As in pandas' Styler, the subset can be None (the whole DataFrame), a tuple
+    (e.g., pd.IndexSlice) of row and column indexers, or a column indexer: a label, a
+    list of labels, a slice or a boolean mask.
+    """
+    if subset is None:
+        data = df
+    elif isinstance(subset, tuple):
+        data = df.loc[subset]
+    else:
+        data = df.loc[:, subset]
+    return bool(np.any(pd.notna(data)))
+
+
 def style_heatmap(df: pd.DataFrame, subsets_info: List[Dict]):
     """Style a pandas DataFrame as a heatmap.
 
@@ -74,7 +113,9 @@ def style_heatmap(df: pd.DataFrame, subsets_info: List[Dict]):
 
     style = df.style
     for si in subsets_info:
-        style = style.background_gradient(**si)
+        # Skip the gradient if there is no value to color
+        if _has_values(df, si.get("subset", None)):
+            style = style.background_gradient(**si)
 
     # Set stick index
     style = style.set_sticky(axis="index")
@@ -135,17 +176,25 @@ def show_evaluation_table(
     """
 
     # Flatten to a tabular format: explainers x evaluation metrics
-    flat = list()
+    # Metrics are listed in order of appearance. Missing scores are NaN
+    metric_pos = dict()
     for evaluation in explanation_evaluations:
-        d = dict()
-        d["Explainer"] = evaluation.explanation.explainer
-
         for metric_output in evaluation.evaluation_outputs:
+            metric_pos.setdefault(metric_output.metric.SHORT_NAME, len(metric_pos))
 
-            d[metric_output.metric.SHORT_NAME] = metric_output.value
-        flat.append(d)
-
-    table = pd.DataFrame(flat).set_index("Explainer")
+    scores = np.full((len(explanation_evaluations), len(metric_pos)), np.nan)
+    for i, evaluation in enumerate(explanation_evaluations):
+        for metric_output in evaluation.evaluation_outputs:
+            scores[i, metric_pos[metric_output.metric.SHORT_NAME]] = metric_output.value
+
+    table = pd.DataFrame(
+        scores,
+        index=pd.Index(
+            [e.explanation.explainer for e in explanation_evaluations],
+            name="Explainer",
+        ),
+        columns=list(metric_pos),
+    )
 
     if not style:
         return table.format("{:.2f}")
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+
+"""Tests for the `ferret` Benchmark evaluation API."""
+
+import unittest
+
+import numpy as np
+from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+from ferret import Benchmark, GradientExplainer, IntegratedGradientExplainer
+
+
+class TestEvaluateExplanations(unittest.TestCase):
+    def setUp(self):
+        model = AutoModelForSequenceClassification.from_pretrained("lvwerra/distilbert-imdb")
+        tokenizer = AutoTokenizer.from_pretrained("lvwerra/distilbert-imdb")
+        self.bench = Benchmark(
+            model,
+            tokenizer,
+            explainers=[
+                GradientExplainer(model, tokenizer),
+                IntegratedGradientExplainer(model, tokenizer),
+            ],
+        )
+        # Explanations of different texts
+        self.explanations = self.bench.explain(
+            "The new movie is awesome!", target=1, show_progress=False
+        ) + self.bench.explain(
+            "I did not like the plot at all.", target=0, show_progress=False
+        )
+
+    def test_threads_match_sequential(self):
+        sequential = self.bench.evaluate_explanations(
+            self.explanations, show_progress=False
+        )
+        threaded = self.bench.evaluate_explanations(
+            self.explanations, show_progress=False, n_workers=2
+        )
+
+        self.assertEqual(len(threaded), len(sequential))
+        for threaded_eval, sequential_eval in zip(threaded, sequential):
+            self.assertEqual(
+                threaded_eval.explanation.explainer, sequential_eval.explanation.explainer
+            )
+            self.assertListEqual(
+                [o.metric.SHORT_NAME for o in threaded_eval.evaluation_outputs],
+                [o.metric.SHORT_NAME for o in sequential_eval.evaluation_outputs],
+            )
+            np.testing.assert_allclose(
+                [o.value for o in threaded_eval.evaluation_outputs],
+                [o.value for o in sequential_eval.evaluation_outputs],
+                rtol=1e-5,
+            )
+
+    def test_mismatched_class_explanations(self):
+        # Class explanations (#targets x #explainers) of the first text only
+        class_explanations = [
+            self.bench.explain("The new movie is awesome!", target=target, show_progress=False)
+            for target in range(2)
+        ]
+        with self.assertRaises(ValueError):
+            self.bench.evaluate_explanations(
+                self.explanations,
+                class_explanations=class_explanations,
+                show_progress=False,
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
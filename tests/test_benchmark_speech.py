@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+
+"""Tests for the `ferret` speech benchmark utilities."""
+
+import unittest
+
+try:
+    from ferret.benchmark_speech import _dedup_column_names
+except ImportError:
+    _dedup_column_names = None
+
+
+@unittest.skipIf(_dedup_column_names is None, "Speech extras are not installed")
+class TestDedupColumnNames(unittest.TestCase):
+    def test_unique_names_are_unchanged(self):
+        self.assertListEqual(_dedup_column_names(["a", "b"]), ["a", "b"])
+
+    def test_duplicated_names(self):
+        self.assertListEqual(
+            _dedup_column_names(["a", "b", "a", "a"]), ["a", "b", "a.1", "a.2"]
+        )
+
+    def test_suffix_collisions(self):
+        self.assertListEqual(
+            _dedup_column_names(["a", "a", "a.1"]), ["a", "a.1", "a.1.1"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+
+"""Tests for the `ferret` datasets API."""
+
+import unittest
+
+from transformers import AutoTokenizer
+
+from ferret import BaseDataset
+
+
+class WordsDataset(BaseDataset):
+    """Minimal dataset to test the rationale alignment utilities."""
+
+    NAME = "words"
+    avg_rationale_size = 1
+
+    def get_instance(self, idx, split_type=None):
+        pass
+
+    def _get_item(self, idx, split_type=None):
+        pass
+
+    def _get_text(self, idx, split_type=None):
+        pass
+
+    def _get_rationale(self, idx, split_type=None):
+        pass
+
+    def _get_ground_truth(self, idx, split_type=None):
+        pass
+
+
+class CountingTokenizer:
+    """Slow tokenizer stub: one token per character, plus CLS and SEP."""
+
+    def __init__(self):
+        self.n_calls = 0
+
+    def encode(self, text):
+        self.n_calls += 1
+        return [101] + [ord(c) for c in text] + [102]
+
+
+class TestRationaleFromWordsToTokens(unittest.TestCase):
+    def test_token_cache(self):
+        tokenizer = CountingTokenizer()
+        dataset = WordsDataset(tokenizer)
+
+        rationale = dataset.get_true_rationale_from_words_to_tokens(
+            ["the", "cat", "the"], [0, 1, 0]
+        )
+        self.assertListEqual(rationale, [0, 0, 0, 1, 1, 1, 0, 0, 0])
+        # The repeated word is encoded once
+        self.assertEqual(tokenizer.n_calls, 2)
+        self.assertEqual(len(dataset._token_cache), 2)
+
+        dataset.clear_token_cache()
+        self.assertEqual(len(dataset._token_cache), 0)
+        dataset.get_true_rationale_from_words_to_tokens(["the"], [1])
+        self.assertEqual(tokenizer.n_calls, 3)
+
+    def test_token_cache_reset_on_new_tokenizer(self):
+        dataset = WordsDataset(CountingTokenizer())
+        dataset.get_true_rationale_from_words_to_tokens(["the"], [1])
+
+        tokenizer = CountingTokenizer()
+        dataset.tokenizer = tokenizer
+        dataset.get_true_rationale_from_words_to_tokens(["the"], [1])
+        self.assertEqual(tokenizer.n_calls, 1)
+
+    def test_fast_tokenizer_matches_per_word(self):
+        words = ["The", "unbelievably", "long", "movie", "was", "great", "!"]
+        rationale = [0, 1, 0, 0, 0, 1, 0]
+
+        fast = WordsDataset(AutoTokenizer.from_pretrained("lvwerra/distilbert-imdb"))
+        slow = WordsDataset(
+            AutoTokenizer.from_pretrained("lvwerra/distilbert-imdb", use_fast=False)
+        )
+        self.assertTrue(fast.tokenizer.is_fast)
+        self.assertListEqual(
+            fast.get_true_rationale_from_words_to_tokens(words, rationale),
+            slow.get_true_rationale_from_words_to_tokens(words, rationale),
+        )
+
+    def test_short_rationale_is_truncated(self):
+        words = ["The", "unbelievably", "long", "movie"]
+
+        fast = WordsDataset(AutoTokenizer.from_pretrained("lvwerra/distilbert-imdb"))
+        slow = WordsDataset(
+            AutoTokenizer.from_pretrained("lvwerra/distilbert-imdb", use_fast=False)
+        )
+        # e.g., HateXplain posts without an annotated rationale
+        self.assertListEqual(fast.get_true_rationale_from_words_to_tokens(words, []), [])
+        self.assertListEqual(
+            fast.get_true_rationale_from_words_to_tokens(words, [0, 1]),
+            slow.get_true_rationale_from_words_to_tokens(words, [0, 1]),
+        )
+
+    def test_bpe_tokenizer_falls_back_to_per_word(self):
+        words = ["The", "unbelievably", "long", "movie", "was", "great", "!"]
+        rationale = [0, 1, 0, 0, 0, 1, 0]
+
+        # Without add_prefix_space=True, pre-split words are rejected
+        fast = WordsDataset(AutoTokenizer.from_pretrained("roberta-base"))
+        slow = WordsDataset(AutoTokenizer.from_pretrained("roberta-base", use_fast=False))
+        self.assertTrue(fast.tokenizer.is_fast)
+        self.assertListEqual(
+            fast.get_true_rationale_from_words_to_tokens(words, rationale),
+            slow.get_true_rationale_from_words_to_tokens(words, rationale),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+
+"""Tests for the `ferret` evaluators."""
+
+import dataclasses
+import unittest
+
+import numpy as np
+from transformers import (
+    AutoModelForSequenceClassification,
+    AutoModelForTokenClassification,
+    AutoTokenizer,
+)
+
+from ferret import (
+    AOPC_Comprehensiveness_Evaluation,
+    AOPC_Sufficiency_Evaluation,
+    GradientExplainer,
+    IntegratedGradientExplainer,
+)
+
+
+class TestAOPCBatchEvaluation(unittest.TestCase):
+    def setUp(self):
+        self.model = AutoModelForSequenceClassification.from_pretrained("lvwerra/distilbert-imdb")
+        self.tokenizer = AutoTokenizer.from_pretrained("lvwerra/distilbert-imdb")
+
+        explanations = [
+            GradientExplainer(self.model, self.tokenizer)("The new movie is awesome!", target=1),
+            IntegratedGradientExplainer(self.model, self.tokenizer)(
+                "I did not like the plot at all.", target=0
+            ),
+        ]
+        # No token influences the prediction positively: no input to score, default score
+        no_rationale = dataclasses.replace(
+            explanations[0], scores=-np.abs(explanations[0].scores) - 0.1
+        )
+        self.explanations = explanations + [no_rationale]
+
+    def _assert_batch_matches_single(self, evaluator, default_score):
+        batch_outputs = evaluator.compute_evaluations(self.explanations)
+        single_outputs = [evaluator.compute_evaluation(e) for e in self.explanations]
+
+        self.assertEqual(len(batch_outputs), len(self.explanations))
+        for batch_output, single_output in zip(batch_outputs, single_outputs):
+            self.assertAlmostEqual(batch_output.value, single_output.value, places=5)
+        self.assertEqual(batch_outputs[-1].value, default_score)
+
+    def test_comprehensiveness(self):
+        evaluator = AOPC_Comprehensiveness_Evaluation(
+            self.model, self.tokenizer, "text-classification"
+        )
+        self._assert_batch_matches_single(evaluator, default_score=0)
+
+    def test_sufficiency(self):
+        evaluator = AOPC_Sufficiency_Evaluation(
+            self.model, self.tokenizer, "text-classification"
+        )
+        self._assert_batch_matches_single(evaluator, default_score=1)
+
+
+class TestAOPCBatchEvaluationNER(unittest.TestCase):
+    def setUp(self):
+        self.model = AutoModelForTokenClassification.from_pretrained(
+            "Babelscape/wikineural-multilingual-ner"
+        ).to("cpu")
+        self.tokenizer = AutoTokenizer.from_pretrained("Babelscape/wikineural-multilingual-ner")
+
+        # Texts of different lengths: token-level logits cannot be concatenated
+        explainers = [
+            GradientExplainer(self.model, self.tokenizer, task_name="ner"),
+            IntegratedGradientExplainer(self.model, self.tokenizer, task_name="ner"),
+        ]
+        self.explanations = [
+            explainer(text, target="I-LOC", target_token="York")
+            for text in [
+                "My name is John and I live in New York",
+                "Last summer we visited New York with the whole family and many friends",
+            ]
+            for explainer in explainers
+        ]
+
+    def test_two_texts(self):
+        for evaluator_class in [
+            AOPC_Comprehensiveness_Evaluation,
+            AOPC_Sufficiency_Evaluation,
+        ]:
+            evaluator = evaluator_class(self.model, self.tokenizer, "ner")
+            batch_outputs = evaluator.compute_evaluations(self.explanations)
+            single_outputs = [evaluator.compute_evaluation(e) for e in self.explanations]
+
+            self.assertEqual(len(batch_outputs), len(self.explanations))
+            for batch_output, single_output in zip(batch_outputs, single_outputs):
+                self.assertAlmostEqual(batch_output.value, single_output.value, places=5)
+
+
+if __name__ == "__main__":
+    unittest.main()